@@ -12,6 +12,7 @@ Exports
 
 __all__ = ("SimulationMinefieldWidget",)
 
+import collections
 import logging
 from typing import Dict, List, Mapping, Optional
 
@@ -20,6 +21,7 @@ from PyQt5.QtGui import QMouseEvent, QPixmap
 from PyQt5.QtWidgets import (
     QDialog,
     QFrame,
+    QGraphicsPixmapItem,
     QGraphicsScene,
     QGraphicsView,
     QSizePolicy,
@@ -46,7 +48,7 @@ class SimulationMinefieldWidget(QDialog):
         super().__init__(parent)
         self._x_size = x_size
         self._y_size = y_size
-        self._remaining_cell_updates = cell_updates
+        self._remaining_cell_updates = collections.deque(cell_updates)
 
         self._cell_images: Dict[CellContents, QPixmap] = {}
         _update_cell_images(
@@ -58,8 +60,13 @@ class SimulationMinefieldWidget(QDialog):
         self.setWindowTitle("Highscore replay")
         self._setup_ui()
 
-        for c in [(x, y) for x in range(self.x_size) for y in range(self.y_size)]:
-            self._set_cell_image(c, CellContents.Unclicked)
+        # One pixmap item per cell, updated in place on each cell update.
+        self._cell_items: Dict[Coord_T, QGraphicsPixmapItem] = {}
+        for x in range(self.x_size):
+            for y in range(self.y_size):
+                item = self._scene.addPixmap(self._cell_images[CellContents.Unclicked])
+                item.setPos(x * self.btn_size, y * self.btn_size)
+                self._cell_items[(x, y)] = item
 
         self._animation_started = False
 
@@ -103,7 +110,7 @@ class SimulationMinefieldWidget(QDialog):
     # --------------------------------------------------------------------------
     def _do_next_update(self):
         """Perform the next set of cell updates."""
-        evt = self._remaining_cell_updates.pop(0)
+        evt = self._remaining_cell_updates.popleft()
         self._update_cells({tuple(c): CellContents.from_str(x) for c, x in evt[1]})
         if self._remaining_cell_updates:
             QTimer.singleShot(
@@ -124,9 +131,7 @@ class SimulationMinefieldWidget(QDialog):
         if state not in self._cell_images:
             logger.error("Missing cell image for state: %s", state)
             return
-        x, y = coord
-        b = self._scene.addPixmap(self._cell_images[state])
-        b.setPos(x * self.btn_size, y * self.btn_size)
+        self._cell_items[coord].setPixmap(self._cell_images[state])
 
     def _update_cells(self, cell_updates: Mapping[Coord_T, CellContents]) -> None:
         """
@@ -30,14 +30,16 @@ tabulate.PRESERVE_WHITESPACE = True
 
 
 def format_highscores(highscores: Iterable[hs.HighscoreStruct]) -> str:
-    return format_highscore_times([(h.name, h.elapsed) for h in highscores])
+    return format_highscore_times((h.name, h.elapsed) for h in highscores)
 
 
 def format_highscore_times(highscores: Iterable[Tuple[str, float]]) -> str:
-    lines = [
-        f"{i+1:2d}. {h[0][:10]:<10s}  {h[1]:7.2f}" for i, h in enumerate(highscores)
-    ]
-    return "\n".join(lines)
+    return "\n".join(
+        [
+            f"{i:2d}. {name[:10]:<10s}  {elapsed:7.2f}"
+            for i, (name, elapsed) in enumerate(highscores, start=1)
+        ]
+    )
 
 
 def format_player_highscores(